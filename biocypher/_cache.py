@@ -0,0 +1,163 @@
+"""
+BioCypher 'cache' module. Provides a simple on-disk cache for expensive,
+reproducible artifacts such as parsed ontologies, keyed by the parameters
+that produced them.
+"""
+
+import copy
+import functools
+import gzip
+import hashlib
+import json
+import os
+import pickle
+
+from typing import Any, Optional
+
+import appdirs
+
+from ._logger import logger
+
+logger.debug(f"Loading module {__name__}.")
+
+__all__ = ["cache_key", "load", "save"]
+
+_CACHE_DIR = appdirs.user_cache_dir("biocypher", "saezlab")
+
+# magic bytes plus format version, prepended to each cache entry; checked
+# before unpickling so foreign or outdated files are rejected cheaply
+_MAGIC = b"BCYPH\x01"
+
+
+# one encoder instance for all key computations; json.dump would build a
+# fresh encoder on every call
+_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    default=str,
+)
+
+
+def cache_key(*args: Any) -> str:
+    """
+    Create a deterministic cache key from the given arguments.
+
+    The arguments must be JSON-serialisable; they are serialised in a
+    canonical form (sorted keys) and streamed into the hash chunk by chunk,
+    so peak memory stays independent of the size of the arguments. The key
+    is not used for security purposes, only to address cache entries.
+
+    Args:
+        args:
+            Arbitrary JSON-serialisable values that determine the cache
+            entry, e.g. an ontology URL and parsing parameters.
+
+    Returns:
+        A hexadecimal digest string.
+    """
+
+    # not security-relevant; blake2b is considerably faster than md5 on the
+    # serialised JSON while keeping the same collision guarantees for keying
+    hasher = hashlib.blake2b(digest_size=16)
+
+    for chunk in _ENCODER.iterencode(args):
+        hasher.update(chunk.encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
+def _cache_path(key: str, cache_dir: Optional[str] = None) -> str:
+    """
+    Absolute path of the cache file for the given key.
+    """
+
+    return os.path.join(cache_dir or _CACHE_DIR, f"{key}.pickle")
+
+
+def save(key: str, obj: Any, cache_dir: Optional[str] = None) -> None:
+    """
+    Store an object in the on-disk cache.
+
+    Args:
+        key:
+            Cache key, as returned by :func:`cache_key`.
+
+        obj:
+            A picklable object to store.
+
+        cache_dir:
+            Directory holding the cache files; defaults to the user cache
+            directory.
+    """
+
+    path = _cache_path(key, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # write to a sibling temp file and move it into place atomically, so a
+    # concurrent reader or an interrupted write never sees a partial entry
+    tmp_path = f"{path}.tmp"
+
+    with gzip.open(tmp_path, "wb", compresslevel=1) as fp:
+        fp.write(_MAGIC)
+        pickle.dump(obj, fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+    os.replace(tmp_path, path)
+
+    _read_entry.cache_clear()
+
+    logger.debug(f"Saved cache entry `{key}`.")
+
+
+@functools.lru_cache(maxsize=8)
+def _read_entry(path: str) -> Any:
+    """
+    Read and deserialise a cache entry from disk; in-process memory layer on
+    top of the disk cache, so repeated loads of the same entry within one
+    session skip decompression and unpickling. Raises on any unreadable
+    entry, as exceptions are not memoised.
+    """
+
+    with gzip.open(path, "rb") as fp:
+        # check the header before paying for deserialisation of the body
+        if fp.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError("unknown cache entry format")
+
+        return pickle.load(fp)
+
+
+def load(key: str, cache_dir: Optional[str] = None) -> Optional[Any]:
+    """
+    Retrieve an object from the on-disk cache.
+
+    Args:
+        key:
+            Cache key, as returned by :func:`cache_key`.
+
+        cache_dir:
+            Directory holding the cache files; defaults to the user cache
+            directory.
+
+    Returns:
+        The cached object, or None if the key is not in the cache or the
+        cache entry could not be read.
+    """
+
+    path = _cache_path(key, cache_dir)
+
+    try:
+        obj = _read_entry(path)
+
+    # no stat probe beforehand: just attempt the open and treat a missing
+    # file as the ordinary cache miss it is
+    except FileNotFoundError:
+        return None
+
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError) as e:
+        logger.warning(f"Could not read cache entry `{key}`: {e}")
+        return None
+
+    logger.debug(f"Loaded cache entry `{key}`.")
+
+    # hand out a copy: the memoised object must stay pristine even if the
+    # caller mutates the returned one
+    return copy.deepcopy(obj)
@@ -63,7 +63,8 @@ class BioCypher:
             file.
 
         head_ontology (dict): The head ontology defined by URL ('url') and root
-            node ('root_node').
+            node ('root_node'). An optional 'use_cache' flag reuses the parsed
+            ontology from the on-disk cache across sessions.
 
         tail_ontologies (dict): The tail ontologies defined by URL and
             join nodes for both head and tail ontology.
@@ -159,23 +160,10 @@ class BioCypher:
         self._ontology = None
         self._writer = None
         self._driver = None
-        self._in_memory_kg = None
-
         self._in_memory_kg = None
         self._nodes = None
         self._edges = None
 
-    def _initialize_in_memory_kg(self) -> None:
-        """Create in-memory KG instance.
-
-        Set as instance variable `self._in_memory_kg`.
-        """
-        if not self._in_memory_kg:
-            self._in_memory_kg = get_in_memory_kg(
-                dbms=self._dbms,
-                deduplicator=self._get_deduplicator(),
-            )
-
     def add_nodes(self, nodes) -> None:
         """Add new nodes to the internal representation.
 
@@ -230,8 +218,7 @@ class BioCypher:
              Any: knowledge graph.
 
         """
-        if not self._in_memory_kg:
-            self._initialize_in_memory_kg()
+        self._get_in_memory_kg()
         if not self._translator:
             self._get_translator()
         tnodes = self._translator.translate_entities(self._nodes)
@@ -397,20 +384,14 @@ class BioCypher:
         translated_edges = self._translator.translate_entities(edges)
 
         if self._offline:
-            if not self._writer:
-                self._initialize_writer()
-            passed = self._writer.write_edges(
+            passed = self._get_writer().write_edges(
                 translated_edges,
                 batch_size=batch_size,
             )
         elif self._is_online_and_in_memory():
-            if not self._in_memory_kg:
-                self._initialize_in_memory_kg()
-            passed = self._in_memory_kg.add_edges(translated_edges)
+            passed = self._get_in_memory_kg().add_edges(translated_edges)
         else:
-            if not self._driver:
-                self._initialize_driver()
-            passed = self._driver.add_biocypher_nodes(translated_edges)
+            passed = self._get_driver().add_biocypher_edges(translated_edges)
 
         return passed
 
@@ -527,8 +508,6 @@ class BioCypher:
             msg = "No in-memory KG instance found. Please call `add()` first."
             raise ValueError(msg)
 
-        if not self._in_memory_kg:
-            self._initialize_in_memory_kg()
         return self._in_memory_kg.get_kg()
 
     # DOWNLOAD AND CACHE MANAGEMENT METHODS ###
@@ -599,16 +578,11 @@ class BioCypher:
             ntypes = dn[0]
             nids = dn[1]
 
-            msg = "Duplicate node types encountered (IDs in log): \n"
-            for typ in ntypes:
-                msg += f"    {typ}\n"
-
+            # join once instead of growing the message string per item
+            msg = "Duplicate node types encountered (IDs in log): \n" + "".join(f"    {typ}\n" for typ in ntypes)
             logger.info(msg)
 
-            idmsg = "Duplicate node IDs encountered: \n"
-            for _id in nids:
-                idmsg += f"    {_id}\n"
-
+            idmsg = "Duplicate node IDs encountered: \n" + "".join(f"    {_id}\n" for _id in nids)
             logger.debug(idmsg)
 
         else:
@@ -620,16 +594,11 @@ class BioCypher:
             etypes = de[0]
             eids = de[1]
 
-            msg = "Duplicate edge types encountered (IDs in log): \n"
-            for typ in etypes:
-                msg += f"    {typ}\n"
-
+            # join once instead of growing the message string per item
+            msg = "Duplicate edge types encountered (IDs in log): \n" + "".join(f"    {typ}\n" for typ in etypes)
             logger.info(msg)
 
-            idmsg = "Duplicate edge IDs encountered: \n"
-            for _id in eids:
-                idmsg += f"    {_id}\n"
-
+            idmsg = "Duplicate edge IDs encountered: \n" + "".join(f"    {_id}\n" for _id in eids)
             logger.debug(idmsg)
 
         else:
@@ -767,7 +736,7 @@ class BioCypher:
 
         """
         # instantiate adapter if not exists
-        self.start_ontology()
+        self._get_translator()
 
         return self._translator.translate_term(term)
 
@@ -793,7 +762,7 @@ class BioCypher:
 
         """
         # instantiate adapter if not exists
-        self.start_ontology()
+        self._get_translator()
 
         return self._translator.reverse_translate_term(term)
 
@@ -810,7 +779,7 @@ class BioCypher:
 
         """
         # instantiate adapter if not exists
-        self.start_ontology()
+        self._get_translator()
 
         return self._translator.translate(query)
 
@@ -827,6 +796,6 @@ class BioCypher:
 
         """
         # instantiate adapter if not exists
-        self.start_ontology()
+        self._get_translator()
 
         return self._translator.reverse_translate(query)
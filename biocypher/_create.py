@@ -3,7 +3,7 @@ BioCypher 'create' module. Handles the creation of BioCypher node and edge
 dataclasses.
 """
 
-import os
+import sys
 
 from dataclasses import dataclass, field
 from typing import Union
@@ -18,8 +18,17 @@ __all__ = [
     "BioCypherRelAsNode",
 ]
 
+# translation table mapping line-break characters to spaces; one C-level
+# translate pass replaces the former chain of three str.replace calls
+# (os.linesep is covered, being one of these characters or both)
+_NEWLINE_TABLE = str.maketrans({"\n": " ", "\r": " "})
 
-@dataclass(frozen=True)
+# sentinel distinguishing "absent" from any real property value, so the
+# reserved-keyword checks below get by with one dict operation each
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
 class BioCypherNode:
     """
     Handoff class to represent biomedical entities as Neo4j nodes.
@@ -62,44 +71,24 @@ class BioCypherNode:
         # TODO actually make None possible here; as is, "id" is the default in
         # the dataclass as well as in the configuration file
 
-        if ":TYPE" in self.properties.keys():
+        if self.properties.pop(":TYPE", _MISSING) is not _MISSING:
             logger.warning(
                 "Keyword ':TYPE' is reserved for Neo4j. Removing from properties.",
                 # "Renaming to 'type'."
             )
-            # self.properties["type"] = self.properties[":TYPE"]
-            del self.properties[":TYPE"]
 
         for k, v in self.properties.items():
             if isinstance(v, str):
-                self.properties[k] = (
-                    v.replace(
-                        os.linesep,
-                        " ",
-                    )
-                    .replace(
-                        "\n",
-                        " ",
-                    )
-                    .replace(
-                        "\r",
-                        " ",
-                    )
-                )
+                self.properties[k] = v.translate(_NEWLINE_TABLE)
 
             elif isinstance(v, list):
-                self.properties[k] = [
-                    val.replace(
-                        os.linesep,
-                        " ",
-                    )
-                    .replace(
-                        "\n",
-                        " ",
-                    )
-                    .replace("\r", " ")
-                    for val in v
-                ]
+                self.properties[k] = [val.translate(_NEWLINE_TABLE) for val in v]
+
+        # a handful of id namespaces recur across millions of nodes;
+        # interning (after the cleaning pass, which copies strings) lets
+        # them share one object and compare by pointer downstream
+        if self.properties["preferred_id"]:
+            self.properties["preferred_id"] = sys.intern(self.properties["preferred_id"])
 
     def get_id(self) -> str:
         """
@@ -162,7 +151,7 @@ class BioCypherNode:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BioCypherEdge:
     """
     Handoff class to represent biomedical relationships in Neo4j.
@@ -186,6 +175,13 @@ class BioCypherEdge:
         properties (dict): collection of all other properties of the
         respective edge
 
+        source_label (string): optional label of the source node; when
+        provided (together with target_label), online merges can match
+        the endpoints under their label-scoped id index instead of
+        scanning all nodes
+
+        target_label (string): optional label of the target node
+
     """
 
     source_id: str
@@ -193,33 +189,32 @@ class BioCypherEdge:
     relationship_label: str
     relationship_id: str = None
     properties: dict = field(default_factory=dict)
+    source_label: str = None
+    target_label: str = None
 
     def __post_init__(self):
         """
         Check for reserved keywords.
         """
 
-        if ":TYPE" in self.properties.keys():
+        # each pop only runs when the previous keyword was absent,
+        # preserving the remove-at-most-one semantics of the former
+        # membership-check-then-delete chain
+        if self.properties.pop(":TYPE", _MISSING) is not _MISSING:
             logger.debug(
                 "Keyword ':TYPE' is reserved for Neo4j. Removing from properties.",
                 # "Renaming to 'type'."
             )
-            # self.properties["type"] = self.properties[":TYPE"]
-            del self.properties[":TYPE"]
-        elif "id" in self.properties.keys():
+        elif self.properties.pop("id", _MISSING) is not _MISSING:
             logger.debug(
                 "Keyword 'id' is reserved for Neo4j. Removing from properties.",
                 # "Renaming to 'type'."
             )
-            # self.properties["type"] = self.properties[":TYPE"]
-            del self.properties["id"]
-        elif "_ID" in self.properties.keys():
+        elif self.properties.pop("_ID", _MISSING) is not _MISSING:
             logger.debug(
                 "Keyword '_ID' is reserved for Postgres. Removing from properties.",
                 # "Renaming to 'type'."
             )
-            # self.properties["type"] = self.properties[":TYPE"]
-            del self.properties["_ID"]
 
     def get_id(self) -> Union[str, None]:
         """
@@ -258,6 +253,24 @@ class BioCypherEdge:
         """
         return self.relationship_label
 
+    def get_source_label(self) -> Union[str, None]:
+        """
+        Returns the label of the source node or None.
+
+        Returns:
+            str: source_label
+        """
+        return self.source_label
+
+    def get_target_label(self) -> Union[str, None]:
+        """
+        Returns the label of the target node or None.
+
+        Returns:
+            str: target_label
+        """
+        return self.target_label
+
     def get_type(self) -> str:
         """
         Returns relationship label.
@@ -295,7 +308,7 @@ class BioCypherEdge:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BioCypherRelAsNode:
     """
     Class to represent relationships as nodes (with in- and outgoing
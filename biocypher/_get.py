@@ -170,7 +170,11 @@ class Downloader:
         """
         cache_record = self._get_cache_record(resource)
         if cache_record:
-            download_time = datetime.strptime(cache_record.get("date_downloaded"), "%Y-%m-%d %H:%M:%S.%f")
+            # the record stores str(datetime); fromisoformat parses that
+            # directly (C implementation, no format-string interpretation)
+            # and also accepts timestamps without a fraction part, which
+            # strptime with a hard-coded %f pattern chokes on
+            download_time = datetime.fromisoformat(cache_record.get("date_downloaded"))
             lifetime = timedelta(days=resource.lifetime)
             expired = download_time + lifetime < datetime.now()
         else:
@@ -251,7 +255,7 @@ class Downloader:
 
             os.makedirs(os.path.dirname(api_path), exist_ok=True)
             with open(api_path, "w") as f:
-                json.dump(response_data, f)
+                json.dump(response_data, f, separators=(",", ":"))
                 logger.info(f"Caching API request to {api_path}.")
             paths.append(api_path)
         return paths
@@ -400,4 +404,4 @@ class Downloader:
         cache_record["lifetime"] = resource.lifetime
         self.cache_dict[resource.name] = cache_record
         with open(self.cache_file, "w") as f:
-            json.dump(self.cache_dict, f, default=str)
+            json.dump(self.cache_dict, f, default=str, separators=(",", ":"))
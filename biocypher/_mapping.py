@@ -3,12 +3,19 @@ BioCypher 'mapping' module. Handles the mapping of user-defined schema to the
 underlying ontology.
 """
 
+import os
+
 from typing import Optional
 from urllib.request import urlopen
 
 import yaml
 
-from . import _misc
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+from . import _cache
 from ._logger import logger
 
 logger.debug(f"Loading module {__name__}.")
@@ -34,12 +41,27 @@ class OntologyMapping:
         # load yaml file from web
         elif config_file.startswith("http"):
             with urlopen(config_file) as f:
-                schema_config = yaml.safe_load(f)
+                schema_config = yaml.load(f, Loader=_SafeLoader)
 
-        # get graph state from config (assume file is local)
+        # get graph state from config (assume file is local); the parsed
+        # schema is cached on disk keyed by path and mtime, so repeated
+        # instantiations skip the YAML parse until the file changes
         else:
-            with open(config_file, "r") as f:
-                schema_config = yaml.safe_load(f)
+            stat = os.stat(config_file)
+            key = _cache.cache_key(
+                "schema_config",
+                os.path.abspath(config_file),
+                stat.st_mtime,
+                stat.st_size,
+            )
+
+            schema_config = _cache.load(key)
+
+            if schema_config is None:
+                with open(config_file, "r") as f:
+                    schema_config = yaml.load(f, Loader=_SafeLoader)
+
+                _cache.save(key, schema_config)
 
         return schema_config
 
@@ -60,169 +82,102 @@ class OntologyMapping:
 
         extended_schema = dict()
 
-        # first pass: get parent leaves with direct representation in ontology
+        # single pass: classify entities; toplevel entities are leaves with
+        # direct representation in the ontology, children carry an `is_a`
+        # definition, and horizontal candidates provide multiple preferred
+        # id types or sources
+        toplevel = []
+        children = []
+        horizontal = []
+
         for k, v in d.items():
-            # k is not an entity
-            if "represented_as" not in v:
-                continue
+            if "represented_as" in v:
+                # preferred_id optional: if not provided, use `id`
+                if not v.get("preferred_id"):
+                    v["preferred_id"] = "id"
 
-            # preferred_id optional: if not provided, use `id`
-            if not v.get("preferred_id"):
-                v["preferred_id"] = "id"
+                # k is an entity that is present in the ontology
+                if "is_a" not in v:
+                    toplevel.append((k, v))
 
-            # k is an entity that is present in the ontology
-            if "is_a" not in v:
-                extended_schema[k] = v
+                if isinstance(v.get("preferred_id"), list) or isinstance(
+                    v.get("source"),
+                    list,
+                ):
+                    horizontal.append((k, v))
 
-        # second pass: "vertical" inheritance
-        d = self._vertical_property_inheritance(d)
-        for k, v in d.items():
             if "is_a" in v:
-                # prevent loops
-                if k == v["is_a"]:
-                    logger.warning(
-                        f"Loop detected in ontology mapping: {k} -> {v}. "
-                        "Removing item. Please fix the inheritance if you want "
-                        "to use this item."
-                    )
-                    continue
+                children.append((k, v))
+
+        for k, v in toplevel:
+            extended_schema[k] = v
+
+        # "vertical" inheritance: inherit properties from parents to children
+        for k, v in children:
+            self._vertical_property_inheritance(v)
+
+            # prevent loops
+            if k == v["is_a"]:
+                logger.warning(
+                    f"Loop detected in ontology mapping: {k} -> {v}. "
+                    "Removing item. Please fix the inheritance if you want "
+                    "to use this item."
+                )
+                continue
 
-                extended_schema[k] = v
+            extended_schema[k] = v
 
         # "horizontal" inheritance: create siblings for multiple identifiers or
         # sources -> virtual leaves or implicit children
-        mi_leaves = {}
-        ms_leaves = {}
-        for k, v in d.items():
-            # k is not an entity
-            if "represented_as" not in v:
-                continue
-
+        for k, v in horizontal:
             if isinstance(v.get("preferred_id"), list):
-                mi_leaves = self._horizontal_inheritance_pid(k, v)
-                extended_schema.update(mi_leaves)
+                extended_schema.update(self._horizontal_inheritance_pid(k, v))
 
             elif isinstance(v.get("source"), list):
-                ms_leaves = self._horizontal_inheritance_source(k, v)
-                extended_schema.update(ms_leaves)
+                extended_schema.update(self._horizontal_inheritance_source(k, v))
 
         return extended_schema
 
-    def _vertical_property_inheritance(self, d):
+    def _vertical_property_inheritance(self, v):
         """
-        Inherit properties from parents to children and update `d` accordingly.
+        Inherit properties from the parent to the child entity `v`, in place.
         """
-        for k, v in d.items():
-            # k is not an entity
-            if "represented_as" not in v:
-                continue
-
-            # k is an entity that is present in the ontology
-            if "is_a" not in v:
-                continue
-
-            # "vertical" inheritance: inherit properties from parent
-            if v.get("inherit_properties", False):
-                # get direct ancestor
-                if isinstance(v["is_a"], list):
-                    parent = v["is_a"][0]
-                else:
-                    parent = v["is_a"]
-
-                # ensure child has properties and exclude_properties
-                if "properties" not in v:
-                    v["properties"] = {}
-                if "exclude_properties" not in v:
-                    v["exclude_properties"] = {}
-
-                # update properties of child
-                parent_props = self.schema[parent].get("properties", {})
-                if parent_props:
-                    v["properties"].update(parent_props)
+        # only entities with representation inherit properties
+        if "represented_as" not in v:
+            return
+
+        # "vertical" inheritance: inherit properties from parent
+        if v.get("inherit_properties", False):
+            # get direct ancestor
+            if isinstance(v["is_a"], list):
+                parent = v["is_a"][0]
+            else:
+                parent = v["is_a"]
 
-                parent_excl_props = self.schema[parent].get("exclude_properties", {})
-                if parent_excl_props:
-                    v["exclude_properties"].update(parent_excl_props)
+            # ensure child has properties and exclude_properties
+            if "properties" not in v:
+                v["properties"] = {}
+            if "exclude_properties" not in v:
+                v["exclude_properties"] = {}
 
-                # update schema (d)
-                d[k] = v
+            # update properties of child
+            parent_props = self.schema[parent].get("properties", {})
+            if parent_props:
+                v["properties"].update(parent_props)
 
-        return d
+            parent_excl_props = self.schema[parent].get("exclude_properties", {})
+            if parent_excl_props:
+                v["exclude_properties"].update(parent_excl_props)
 
     def _horizontal_inheritance_pid(self, key, value):
         """
-        Create virtual leaves for multiple preferred id types or sources.
+        Create virtual leaves for multiple preferred id types.
 
         If we create virtual leaves, input_label/label_in_input always has to be
         a list.
         """
 
-        leaves = {}
-
-        preferred_id = value["preferred_id"]
-        input_label = value.get("input_label") or value["label_in_input"]
-        represented_as = value["represented_as"]
-
-        # adjust lengths
-        max_l = max(
-            [
-                len(_misc.to_list(preferred_id)),
-                len(_misc.to_list(input_label)),
-                len(_misc.to_list(represented_as)),
-            ],
-        )
-
-        # adjust pid length if necessary
-        if isinstance(preferred_id, str):
-            pids = [preferred_id] * max_l
-        else:
-            pids = preferred_id
-
-        # adjust rep length if necessary
-        if isinstance(represented_as, str):
-            reps = [represented_as] * max_l
-        else:
-            reps = represented_as
-
-        for pid, lab, rep in zip(pids, input_label, reps):
-            skey = pid + "." + key
-            svalue = {
-                "preferred_id": pid,
-                "input_label": lab,
-                "represented_as": rep,
-                # mark as virtual
-                "virtual": True,
-            }
-
-            # inherit is_a if exists
-            if "is_a" in value.keys():
-                # treat as multiple inheritance
-                if isinstance(value["is_a"], list):
-                    v = list(value["is_a"])
-                    v.insert(0, key)
-                    svalue["is_a"] = v
-
-                else:
-                    svalue["is_a"] = [key, value["is_a"]]
-
-            else:
-                # set parent as is_a
-                svalue["is_a"] = key
-
-            # inherit everything except core attributes
-            for k, v in value.items():
-                if k not in [
-                    "is_a",
-                    "preferred_id",
-                    "input_label",
-                    "label_in_input",
-                    "represented_as",
-                ]:
-                    svalue[k] = v
-
-            leaves[skey] = svalue
-
-        return leaves
+        return self._horizontal_inheritance(key, value, by="preferred_id")
 
     def _horizontal_inheritance_source(self, key, value):
         """
@@ -232,31 +187,51 @@ class OntologyMapping:
         a list.
         """
 
+        return self._horizontal_inheritance(key, value, by="source")
+
+    def _horizontal_inheritance(self, key, value, by):
+        """
+        Create virtual leaves for the values of the discriminating attribute
+        `by` (``preferred_id`` or ``source``); shared implementation of the
+        two public variants above.
+        """
+
         leaves = {}
 
-        source = value["source"]
+        discriminator = value[by]
         input_label = value.get("input_label") or value["label_in_input"]
         represented_as = value["represented_as"]
 
-        # adjust lengths
-        src_l = len(source)
-
-        # adjust label length if necessary
-        if isinstance(input_label, str):
-            labels = [input_label] * src_l
-        else:
-            labels = input_label
-
-        # adjust rep length if necessary
-        if isinstance(represented_as, str):
-            reps = [represented_as] * src_l
-        else:
-            reps = represented_as
+        # adjust lengths; single strings count as one element without the
+        # intermediate to_list allocations
+        max_l = max(
+            1 if isinstance(discriminator, str) else len(discriminator),
+            1 if isinstance(input_label, str) else len(input_label),
+            1 if isinstance(represented_as, str) else len(represented_as),
+        )
 
-        for src, lab, rep in zip(source, labels, reps):
-            skey = src + "." + key
+        def expand(attr):
+            # broadcast single values to the common length
+            return [attr] * max_l if isinstance(attr, str) else attr
+
+        # core attributes are handled explicitly when building the
+        # virtual leaf; everything else is inherited verbatim
+        core_attrs = {
+            "is_a",
+            by,
+            "input_label",
+            "label_in_input",
+            "represented_as",
+        }
+
+        for dis, lab, rep in zip(
+            expand(discriminator),
+            expand(input_label),
+            expand(represented_as),
+        ):
+            skey = dis + "." + key
             svalue = {
-                "source": src,
+                by: dis,
                 "input_label": lab,
                 "represented_as": rep,
                 # mark as virtual
@@ -264,7 +239,7 @@ class OntologyMapping:
             }
 
             # inherit is_a if exists
-            if "is_a" in value.keys():
+            if "is_a" in value:
                 # treat as multiple inheritance
                 if isinstance(value["is_a"], list):
                     v = list(value["is_a"])
@@ -280,13 +255,7 @@ class OntologyMapping:
 
             # inherit everything except core attributes
             for k, v in value.items():
-                if k not in [
-                    "is_a",
-                    "source",
-                    "input_label",
-                    "label_in_input",
-                    "represented_as",
-                ]:
+                if k not in core_attrs:
                     svalue[k] = v
 
             leaves[skey] = svalue
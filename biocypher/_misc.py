@@ -3,8 +3,12 @@ Handy functions for use in various places.
 """
 
 import re
+import sys
+import types
 
+from collections import defaultdict, deque
 from collections.abc import Iterable
+from functools import lru_cache
 from typing import (
     Any,
     Generator,
@@ -46,19 +50,29 @@ LIST_LIKE = (
     ValuesView,
 )
 
+# exact concrete types covering nearly all values passed through the
+# helpers below; one frozenset hash probe short-circuits the linear
+# subclass checks isinstance runs against the LIST_LIKE tuple of ABCs
+_LIST_LIKE_EXACT = frozenset({list, set, tuple, dict, types.GeneratorType})
+
+# same idea for the scalar side: a str or int failing the LIST_LIKE
+# isinstance check first walks every ABC in that tuple; one probe here
+# settles it
+_SIMPLE_TYPES_EXACT = frozenset(SIMPLE_TYPES)
+
 
 def to_list(value: Any) -> list:
     """
     Ensures that ``value`` is a list.
     """
 
-    if isinstance(value, LIST_LIKE):
-        value = list(value)
+    if type(value) is list:  # noqa: E721 (exact check: hand back the same object, no copy)
+        return value
 
-    else:
-        value = [value]
+    if type(value) in _LIST_LIKE_EXACT or isinstance(value, LIST_LIKE):
+        return list(value)
 
-    return value
+    return [value]
 
 
 def ensure_iterable(value: Any) -> Iterable:
@@ -66,6 +80,12 @@ def ensure_iterable(value: Any) -> Iterable:
     Returns iterables, except strings, wraps simple types into tuple.
     """
 
+    if type(value) in _LIST_LIKE_EXACT:
+        return value
+
+    if type(value) in _SIMPLE_TYPES_EXACT:
+        return (value,)
+
     return value if isinstance(value, LIST_LIKE) else (value,)
 
 
@@ -76,17 +96,32 @@ def create_tree_visualisation(inheritance_graph: Union[dict, nx.Graph]) -> Tree:
     inheritance_tree = _get_inheritance_tree(inheritance_graph)
     classes, root = _find_root_node(inheritance_tree)
 
+    # index children by parent and attach them in a single traversal from
+    # the root, instead of re-scanning all classes until a fixed point
+    children_of = defaultdict(list)
+    for child in classes:
+        children_of[inheritance_tree[child]].append(child)
+
     tree = Tree()
     tree.create_node(root, root)
-    while classes:
-        for child in classes:
-            parent = inheritance_tree[child]
-            if parent in tree.nodes.keys() or parent == root:
-                tree.create_node(child, child, parent=parent)
 
-        for node in tree.nodes.keys():
-            if node in classes:
-                classes.remove(node)
+    queue = deque(children_of[root])
+    while queue:
+        child = queue.popleft()
+        tree.create_node(child, child, parent=inheritance_tree[child])
+        queue.extend(children_of[child])
+
+    # classes whose ancestry never reaches the root cannot be attached;
+    # previously they were dropped without a trace (the size comparison
+    # only pre-filters: the root itself may be one of the classes)
+    if len(tree) <= len(classes):
+        orphans = [c for c in classes if not tree.contains(c)]
+
+        if orphans:
+            logger.warning(
+                "The following classes are not connected to the root of the "
+                f"inheritance tree and are not displayed: {orphans}."
+            )
 
     return tree
 
@@ -101,9 +136,20 @@ def _get_inheritance_tree(inheritance_graph: Union[dict, nx.Graph]) -> dict:
         A dict representing the inheritance tree.
     """
     if isinstance(inheritance_graph, nx.Graph):
-        inheritance_tree = nx.to_dict_of_lists(inheritance_graph)
+        # single pass over the adjacency instead of materialising a full
+        # dict-of-lists and rescanning it for the warning and the unlisting
+        inheritance_tree = {}
+        multiple_parents_present = False
+
+        for node, adjacency in inheritance_graph.adjacency():
+            if not adjacency:
+                continue
+
+            if len(adjacency) > 1:
+                multiple_parents_present = True
+
+            inheritance_tree[node] = next(iter(adjacency))
 
-        multiple_parents_present = _multiple_inheritance_present(inheritance_tree)
         if multiple_parents_present:
             logger.warning(
                 "The ontology contains multiple inheritance (one child node "
@@ -114,20 +160,34 @@ def _get_inheritance_tree(inheritance_graph: Union[dict, nx.Graph]) -> dict:
                 "`to_disk = <directory>` and view this file."
             )
 
-        # unlist values
-        inheritance_tree = {k: v[0] for k, v in inheritance_tree.items() if v}
         return inheritance_tree
-    elif not _multiple_inheritance_present(inheritance_graph):
-        return inheritance_graph
+
+    # dict input: values are single parents or lists of parents; the
+    # latter get the same warn-and-unlist treatment as the graph branch
+    # (previously this path silently returned None)
+    if any(isinstance(v, list) for v in inheritance_graph.values()):
+        if _multiple_inheritance_present(inheritance_graph):
+            logger.warning(
+                "The ontology contains multiple inheritance (one child node "
+                "has multiple parent nodes). This is not visualized in the "
+                "following hierarchy tree (the child node is only added once). "
+                "If you wish to browse all relationships of the parsed "
+                "ontologies, write a graphml file to disk using "
+                "`to_disk = <directory>` and view this file."
+            )
+
+        return {k: v[0] if isinstance(v, list) else v for k, v in inheritance_graph.items() if v}
+
+    return inheritance_graph
 
 
 def _multiple_inheritance_present(inheritance_tree: dict) -> bool:
     """Checks if multiple inheritance is present in the inheritance_tree."""
-    return any(len(value) > 1 for value in inheritance_tree.values())
+    return any(isinstance(value, list) and len(value) > 1 for value in inheritance_tree.values())
 
 
 def _find_root_node(inheritance_tree: dict) -> tuple[set, str]:
-    classes = set(inheritance_tree.keys())
+    classes = set(inheritance_tree)
     parents = set(inheritance_tree.values())
     root = list(parents - classes)
     if len(root) > 1:
@@ -139,7 +199,7 @@ def _find_root_node(inheritance_tree: dict) -> tuple[set, str]:
         root = root[0]
     if not root:
         # find key whose value is None
-        root = list(inheritance_tree.keys())[list(inheritance_tree.values()).index(None)]
+        root = list(inheritance_tree)[list(inheritance_tree.values()).index(None)]
     return classes, root
 
 
@@ -148,12 +208,25 @@ lowercase_pattern = re.compile(r"[a-zA-Z]*[a-z][a-zA-Z]*")
 underscore_pattern = re.compile(r"(?<!^)(?=[A-Z][a-z])")
 
 
+# module-level replacement callbacks: a lambda in the call would be
+# allocated per conversion, these are bound once
+def _lower_match(match: re.Match) -> str:
+    return match.group(0).lower()
+
+
+def _upper_group1(match: re.Match) -> str:
+    return match.group(1).upper()
+
+
+@lru_cache(maxsize=None)
+def _word_start_pattern(sep: str) -> re.Pattern:
+    # only a handful of distinct separator classes occur; compile each once
+    return re.compile(r"(?:^|[" + sep + "])([a-zA-Z])")
+
+
 def from_pascal(s: str, sep: str = " ") -> str:
     underscored = underscore_pattern.sub(sep, s)
-    lowercased = lowercase_pattern.sub(
-        lambda match: match.group(0).lower(),
-        underscored,
-    )
+    lowercased = lowercase_pattern.sub(_lower_match, underscored)
     return lowercased
 
 
@@ -183,10 +256,14 @@ def snakecase_to_sentencecase(s: str) -> str:
     return stringcase.sentencecase(s).lower()
 
 
+@lru_cache(maxsize=4096)
 def sentencecase_to_snakecase(s: str) -> str:
     """
     Convert sentence case to snake_case.
 
+    Memoised: the same class names recur across schema and ontology
+    traversals, so repeat conversions are a cache hit.
+
     Args:
         s: Input string in sentence case
 
@@ -196,28 +273,42 @@ def sentencecase_to_snakecase(s: str) -> str:
     return stringcase.snakecase(s).lower()
 
 
+@lru_cache(maxsize=4096)
 def sentencecase_to_pascalcase(s: str, sep: str = r"\s") -> str:
     """
     Convert sentence case to PascalCase.
 
+    Memoised: the same class names recur across schema and ontology
+    traversals, so repeat conversions are a cache hit.
+
     Args:
         s: Input string in sentence case
 
     Returns:
         string in PascalCase form
     """
-    return re.sub(
-        r"(?:^|[" + sep + "])([a-zA-Z])",
-        lambda match: match.group(1).upper(),
-        s,
-    )
+    # fast path for the common case of single-space-separated words, each
+    # starting with an ASCII letter: capitalise word starts without the
+    # regex engine; anything irregular falls through to the regex below
+    if sep == r"\s" and not any(c in s for c in "\t\n\r\v\f"):
+        words = s.split(" ")
+
+        if all(w and ("a" <= w[0] <= "z" or "A" <= w[0] <= "Z") for w in words):
+            return "".join(w[0].upper() + w[1:] for w in words)
 
+    return _word_start_pattern(sep).sub(_upper_group1, s)
 
+
+@lru_cache(maxsize=4096)
 def to_lower_sentence_case(s: str) -> str:
     """
     Convert any string to lower sentence case. Works with snake_case,
     PascalCase, and sentence case.
 
+    The same labels recur once per ontology node or entity, so results
+    are memoised and interned: repeated conversions cost a cache hit and
+    identical labels share one string object downstream.
+
     Args:
         s: Input string
 
@@ -225,13 +316,13 @@ def to_lower_sentence_case(s: str) -> str:
         string in lower sentence case form
     """
     if "_" in s:
-        return snakecase_to_sentencecase(s)
+        return sys.intern(snakecase_to_sentencecase(s))
     elif " " in s:
-        return s.lower()
+        return sys.intern(s.lower())
     elif s[0].isupper():
-        return pascalcase_to_sentencecase(s)
+        return sys.intern(pascalcase_to_sentencecase(s))
     else:
-        return s
+        return sys.intern(s)
 
 
 def is_nested(lst) -> bool:
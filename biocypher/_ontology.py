@@ -4,6 +4,7 @@ other advanced operations.
 """
 
 import os
+import sys
 
 from datetime import datetime
 from typing import Optional
@@ -14,6 +15,7 @@ import rdflib
 from rdflib import Graph
 from rdflib.extras.external_graph_libs import rdflib_to_networkx_digraph
 
+from . import _cache
 from ._logger import logger
 from ._mapping import OntologyMapping
 from ._misc import (
@@ -37,6 +39,19 @@ class OntologyAdapter:
     Identifiers are taken as defined and the prefixes are removed by default.
     """
 
+    #: instance attributes that make up the picklable state, in fixed order
+    _DATA_ATTRS = (
+        "_ontology_file",
+        "_root_label",
+        "_format",
+        "_merge_nodes",
+        "_head_join_node",
+        "_switch_label_and_id",
+        "_remove_prefixes",
+        "_rdf_graph",
+        "_nx_graph",
+    )
+
     def __init__(
         self,
         ontology_file: str,
@@ -46,6 +61,7 @@ class OntologyAdapter:
         merge_nodes: bool | None = True,
         switch_label_and_id: bool = True,
         remove_prefixes: bool = True,
+        use_cache: bool = False,
     ):
         """Initialize the OntologyAdapter class.
 
@@ -76,6 +92,11 @@ class OntologyAdapter:
             remove_prefixes (bool): If True, the prefixes of the identifiers will
                 be removed. Defaults to True.
 
+            use_cache (bool): If True, the parsed ontology graphs are stored in
+                the on-disk cache and reused on subsequent instantiations with
+                the same parameters, skipping the costly parsing step. Defaults
+                to False.
+
         """
         logger.info(f"Instantiating OntologyAdapter class for {ontology_file}.")
 
@@ -87,9 +108,86 @@ class OntologyAdapter:
         self._switch_label_and_id = switch_label_and_id
         self._remove_prefixes = remove_prefixes
 
-        self._rdf_graph = self._load_rdf_graph(ontology_file)
+        self._use_cache = use_cache
+        self._rdf_graph = None
+        self._nx_graph = None
+
+        cached = self._from_cache() if use_cache else None
+
+        if cached is not None:
+            self.__setstate__(cached)
+        else:
+            # parse eagerly and validate the root label, so a bad label
+            # fails at construction as before; only the nx conversion in
+            # _ensure_graphs is deferred to first use
+            self._rdf_graph = self._load_rdf_graph(ontology_file)
+            self._find_root_label(self._rdf_graph, root_label)
+
+    def _ensure_graphs(self) -> None:
+        """
+        Build the graph representations from the parsed ontology on first
+        use; adapters that are never queried skip the conversion.
+        """
+
+        if self._nx_graph is not None:
+            return
+
+        if self._rdf_graph is None:
+            self._rdf_graph = self._load_rdf_graph(self._ontology_file)
+
+        self._nx_graph = self._rdf_to_nx(
+            self._rdf_graph,
+            self._root_label,
+            self._switch_label_and_id,
+        )
+
+        if getattr(self, "_use_cache", False):
+            _cache.save(self._cache_key(), self.__getstate__())
+
+    def __getstate__(self) -> tuple:
+        """
+        Picklable state as a tuple in ``_DATA_ATTRS`` order; tuples pickle
+        with less overhead than the instance dict.
+        """
+
+        return tuple(getattr(self, a) for a in self._DATA_ATTRS)
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Restore the state produced by :meth:`__getstate__`.
+        """
+
+        self.__dict__.update(zip(self._DATA_ATTRS, state))
+
+    def _cache_key(self) -> str:
+        """
+        Cache key for the parsed ontology graphs.
+
+        Includes all parameters that influence parsing; for local files, also
+        the modification time, to invalidate the cache when the file changes.
+        """
+
+        mtime = None
+
+        if os.path.exists(self._ontology_file):
+            mtime = os.path.getmtime(self._ontology_file)
+
+        return _cache.cache_key(
+            self._ontology_file,
+            self._root_label,
+            self._format,
+            self._merge_nodes,
+            self._switch_label_and_id,
+            self._remove_prefixes,
+            mtime,
+        )
+
+    def _from_cache(self):
+        """
+        Retrieve the parsed ontology graphs from the on-disk cache, if present.
+        """
 
-        self._nx_graph = self._rdf_to_nx(self._rdf_graph, root_label, switch_label_and_id)
+        return _cache.load(self._cache_key())
 
     def _rdf_to_nx(
         self,
@@ -231,14 +329,16 @@ class OntologyAdapter:
             nx.DiGraph: The networkx graph with labels
 
         """
-        for node in list(nx_graph.nodes):
+        # one pass with the attribute dicts in hand; the list() materialises
+        # the view, as nodes without an id are removed while iterating
+        for node, data in list(nx_graph.nodes(data=True)):
             nx_id, nx_label = self._get_nx_id_and_label(node, switch_label_and_id)
             if nx_id == "none":
                 # remove node if it has no id
                 nx_graph.remove_node(node)
                 continue
 
-            nx_graph.nodes[node]["label"] = nx_label
+            data["label"] = nx_label
         return nx_graph
 
     def _change_nodes_to_biocypher_format(
@@ -313,6 +413,18 @@ class OntologyAdapter:
             tuple[str, str]: The renamed node id and label
 
         """
+        # memoised per node and flags: labelling and renaming each call this
+        # for every node, so without the memo every rdflib label lookup runs
+        # twice per parse
+        memo = getattr(self, "_id_label_memo", None)
+        if memo is None:
+            memo = self._id_label_memo = {}
+
+        key = (node, switch_id_and_label, rename_nodes)
+        cached = memo.get(key)
+        if cached is not None:
+            return cached
+
         node_id_str = self._remove_prefix(str(node))
         node_label_str = str(self._rdf_graph.value(node, rdflib.RDFS.label))
         if rename_nodes:
@@ -320,7 +432,12 @@ class OntologyAdapter:
             node_label_str = to_lower_sentence_case(node_label_str)
         nx_id = node_label_str if switch_id_and_label else node_id_str
         nx_label = node_id_str if switch_id_and_label else node_label_str
-        return nx_id, nx_label
+        # intern the strings: the same labels recur as node ids, attribute
+        # values and ancestor entries, so sharing one object per distinct
+        # string cuts memory and makes later comparisons pointer-fast
+        result = (sys.intern(nx_id), sys.intern(nx_label))
+        memo[key] = result
+        return result
 
     def _find_root_label(self, g, root_label):
         # Loop through all labels in the ontology
@@ -384,10 +501,31 @@ class OntologyAdapter:
 
     def get_nx_graph(self):
         """Get the networkx graph representing the ontology."""
+        self._ensure_graphs()
         return self._nx_graph
 
+    def _find_node_by_label(self, label: str):
+        """Find the graph node carrying the given label attribute, or None.
+
+        Uses a lazily built label index instead of scanning all nodes per
+        lookup; the graph is static after parsing, so the index never needs
+        invalidation. On duplicate labels, the first node in graph order
+        wins, as with the former linear scan.
+        """
+        index = getattr(self, "_label_index", None)
+
+        if index is None:
+            index = {}
+            for node, data in self.get_nx_graph().nodes(data=True):
+                if "label" in data and data["label"] not in index:
+                    index[data["label"]] = node
+            self._label_index = index
+
+        return index.get(label)
+
     def get_rdf_graph(self):
         """Get the RDFlib graph representing the ontology."""
+        self._ensure_graphs()
         return self._rdf_graph
 
     def get_root_node(self):
@@ -405,16 +543,13 @@ class OntologyAdapter:
         if self._switch_label_and_id:
             root_node = to_lower_sentence_case(root_label)
         elif not self._switch_label_and_id:
-            for node, data in self.get_nx_graph().nodes(data=True):
-                if "label" in data and data["label"] == to_lower_sentence_case(root_label):
-                    root_node = node
-                    break
+            root_node = self._find_node_by_label(to_lower_sentence_case(root_label))
 
         return root_node
 
     def get_ancestors(self, node_label):
         """Get the ancestors of a node in the ontology."""
-        return nx.dfs_preorder_nodes(self._nx_graph, node_label)
+        return nx.dfs_preorder_nodes(self.get_nx_graph(), node_label)
 
     def get_head_join_node(self):
         """Get the head join node of the ontology."""
@@ -455,6 +590,14 @@ class Ontology:
         # keep track of nodes that have been extended
         self._extended_nodes = set()
 
+        # per-node ancestor cache; the graph is static after instantiation
+        self._ancestors_cache = {}
+
+        # rendered tree visualisations, keyed by the `full` flag; rebuilding
+        # the treelib tree on every show_ontology_structure call is wasted
+        # work on a static graph
+        self._tree_cache = {}
+
         self._main()
 
     def _main(self) -> None:
@@ -491,6 +634,7 @@ class Ontology:
             root_label=self._head_ontology_meta["root_node"],
             ontology_file_format=self._head_ontology_meta.get("format", None),
             switch_label_and_id=self._head_ontology_meta.get("switch_label_and_id", True),
+            use_cache=self._head_ontology_meta.get("use_cache", False),
         )
 
         if self._tail_ontology_meta:
@@ -503,6 +647,7 @@ class Ontology:
                     ontology_file_format=value.get("format", None),
                     merge_nodes=value.get("merge_nodes", True),
                     switch_label_and_id=value.get("switch_label_and_id", True),
+                    use_cache=value.get("use_cache", False),
                 )
 
     def _get_head_join_node(self, adapter: OntologyAdapter) -> str:
@@ -523,10 +668,9 @@ class Ontology:
         if self._head_ontology._switch_label_and_id:
             head_join_node = head_join_node_label_in_bc_format
         elif not self._head_ontology._switch_label_and_id:
-            for node_id, data in self._head_ontology.get_nx_graph().nodes(data=True):
-                if "label" in data and data["label"] == head_join_node_label_in_bc_format:
-                    head_join_node = node_id
-                    break
+            head_join_node = self._head_ontology._find_node_by_label(
+                head_join_node_label_in_bc_format,
+            )
 
         if head_join_node not in self._head_ontology.get_nx_graph().nodes:
             head_ontology = self._head_ontology._rdf_to_nx(
@@ -557,12 +701,19 @@ class Ontology:
         tail_join_node = adapter.get_root_node()
         tail_ontology = adapter.get_nx_graph()
 
-        # subtree of tail ontology at join node
-        tail_ontology_subtree = nx.dfs_tree(tail_ontology.reverse(), tail_join_node).reverse()
+        # subtree of tail ontology at join node; reverse(copy=False) gives a
+        # read-only view, enough for the traversal, instead of copying the
+        # whole tail ontology just to orient the search parent-to-child
+        tail_ontology_subtree = nx.dfs_tree(
+            tail_ontology.reverse(copy=False),
+            tail_join_node,
+        ).reverse()
 
-        # transfer node attributes from tail ontology to subtree
-        for node in tail_ontology_subtree.nodes:
-            tail_ontology_subtree.nodes[node].update(tail_ontology.nodes[node])
+        # transfer node attributes from tail ontology to subtree; iterate
+        # with data=True so each node's attribute dict is fetched once
+        tail_nodes = tail_ontology.nodes
+        for node, data in tail_ontology_subtree.nodes(data=True):
+            data.update(tail_nodes[node])
 
         # if merge_nodes is False, create parent of tail join node from head
         # join node
@@ -608,12 +759,10 @@ class Ontology:
 
                 continue
 
-            parents = to_list(value.get("is_a"))
             child = key
 
-            while parents:
-                parent = parents.pop(0)
-
+            # iterate the inheritance chain in order; no list mutation needed
+            for parent in to_list(value.get("is_a")):
                 if parent not in self._nx_graph.nodes:
                     self._nx_graph.add_node(parent)
                     self._nx_graph.nodes[parent]["label"] = sentencecase_to_pascalcase(parent)
@@ -670,11 +819,16 @@ class Ontology:
                 self._nx_graph.nodes[key].update(value)
 
             if value.get("synonym_for"):
-                # change node label to synonym
+                # change node label to synonym; in-place relabel, a copy of
+                # the whole graph per synonym adds up on large ontologies
                 if value["synonym_for"] not in self._nx_graph.nodes:
                     raise ValueError(f"Node {value['synonym_for']} not found in ontology.")
 
-                self._nx_graph = nx.relabel_nodes(self._nx_graph, {value["synonym_for"]: key})
+                self._nx_graph = nx.relabel_nodes(
+                    self._nx_graph,
+                    {value["synonym_for"]: key},
+                    copy=False,
+                )
 
     def get_ancestors(self, node_label: str) -> list:
         """Get the ancestors of a node in the ontology.
@@ -688,7 +842,16 @@ class Ontology:
             list: A list of the ancestors of the node.
 
         """
-        return nx.dfs_tree(self._nx_graph, node_label)
+        ancestors = self._ancestors_cache.get(node_label)
+
+        if ancestors is None:
+            # edges point child to parent, so a forward preorder walk yields
+            # the node itself followed by its ancestors; a plain list is much
+            # lighter to build and cache than the former dfs_tree DiGraph
+            ancestors = list(nx.dfs_preorder_nodes(self._nx_graph, node_label))
+            self._ancestors_cache[node_label] = ancestors
+
+        return ancestors
 
     def show_ontology_structure(self, to_disk: str = None, full: bool = False):
         """Show the ontology structure using treelib or write to GRAPHML file.
@@ -727,10 +890,10 @@ class Ontology:
 
         if not full:
             # set of leaves and their intermediate parents up to the root
-            filter_nodes = set(self.mapping.extended_schema.keys())
+            filter_nodes = set(self.mapping.extended_schema)
 
-            for node in self.mapping.extended_schema.keys():
-                filter_nodes.update(self.get_ancestors(node).nodes)
+            for node in self.mapping.extended_schema:
+                filter_nodes.update(self.get_ancestors(node))
 
             # filter graph
             G = self._nx_graph.subgraph(filter_nodes)
@@ -739,35 +902,39 @@ class Ontology:
             G = self._nx_graph
 
         if not to_disk:
-            # create tree
-            tree = create_tree_visualisation(G)
+            tree = self._tree_cache.get(full)
 
-            # add synonym information
-            for node in self.mapping.extended_schema:
-                if not isinstance(self.mapping.extended_schema[node], dict):
-                    continue
-                if self.mapping.extended_schema[node].get("synonym_for"):
-                    tree.nodes[node].tag = f"{node} = {self.mapping.extended_schema[node].get('synonym_for')}"
+            if tree is None:
+                # create tree
+                tree = create_tree_visualisation(G)
+
+                # add synonym information
+                for node, value in self.mapping.extended_schema.items():
+                    if not isinstance(value, dict):
+                        continue
+                    if value.get("synonym_for"):
+                        tree.nodes[node].tag = f"{node} = {value.get('synonym_for')}"
+
+                self._tree_cache[full] = tree
 
             logger.info(f"\n{tree}")
 
             return tree
 
         else:
-            # convert lists/dicts to strings for vis only
-            for node in G.nodes:
-                # rename node and use former id as label
-                label = G.nodes[node].get("label")
+            # rename nodes to their labels and use the former id as label;
+            # one relabel pass instead of a full graph copy per node
+            mapping = {node: G.nodes[node].get("label") or node for node in G.nodes}
 
-                if not label:
-                    label = node
+            G = nx.relabel_nodes(G, mapping)
 
-                G = nx.relabel_nodes(G, {node: label})
+            for node, label in mapping.items():
                 G.nodes[label]["label"] = node
 
-                for attrib in G.nodes[label]:
-                    if type(G.nodes[label][attrib]) in [list, dict]:
-                        G.nodes[label][attrib] = str(G.nodes[label][attrib])
+                # convert lists/dicts to strings for vis only
+                for attrib, value in G.nodes[label].items():
+                    if type(value) in [list, dict]:
+                        G.nodes[label][attrib] = str(value)
 
             path = os.path.join(to_disk, "ontology_structure.graphml")
 
@@ -3,7 +3,11 @@ BioCypher 'translation' module. Responsible for translating between the raw
 input data and the BioCypherNode and BioCypherEdge objects.
 """
 
+import re
+import sys
+
 from collections.abc import Generator, Iterable
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 from more_itertools import peekable
@@ -55,6 +59,11 @@ class Translator:
         self.mappings = {}
         self.reverse_mappings = {}
 
+        # compiled label patterns for query translation, built lazily and
+        # invalidated whenever the mappings change
+        self._translate_pattern = None
+        self._reverse_translate_pattern = None
+
         self._update_ontology_types()
 
     def translate_entities(self, entities):
@@ -158,10 +167,10 @@ class Translator:
             exclude_props = [exclude_props]
 
         if filter_props and exclude_props:
-            filtered_props = {k: v for k, v in props.items() if (k in filter_props.keys() and k not in exclude_props)}
+            filtered_props = {k: v for k, v in props.items() if (k in filter_props and k not in exclude_props)}
 
         elif filter_props:
-            filtered_props = {k: v for k, v in props.items() if k in filter_props.keys()}
+            filtered_props = {k: v for k, v in props.items() if k in filter_props}
 
         elif exclude_props:
             filtered_props = {k: v for k, v in props.items() if k not in exclude_props}
@@ -169,7 +178,7 @@ class Translator:
         else:
             return props
 
-        missing_props = [k for k in filter_props.keys() if k not in filtered_props.keys()]
+        missing_props = [k for k in filter_props if k not in filtered_props]
         # add missing properties with default values
         for k in missing_props:
             filtered_props[k] = None
@@ -384,33 +393,50 @@ class Translator:
         """
         Translate a cypher query. Only translates labels as of now.
         """
-        for key in self.mappings:
-            query = query.replace(":" + key, ":" + self.mappings[key])
-        return query
+        if not self.mappings:
+            return query
+
+        if self._translate_pattern is None:
+            # longest keys first, so that a key that is a prefix of another
+            # does not shadow it in the alternation
+            alternation = "|".join(re.escape(key) for key in sorted(self.mappings, key=len, reverse=True))
+            self._translate_pattern = re.compile(f":({alternation})")
+
+        return self._translate_pattern.sub(
+            lambda match: ":" + self.mappings[match.group(1)],
+            query,
+        )
 
     def reverse_translate(self, query):
         """
         Reverse translate a cypher query. Only translates labels as of
         now.
         """
-        for key in self.reverse_mappings:
-            a = ":" + key + ")"
-            b = ":" + key + "]"
-            # TODO this conditional probably does not cover all cases
-            if a in query or b in query:
-                if isinstance(self.reverse_mappings[key], list):
-                    raise NotImplementedError(
-                        "Reverse translation of multiple inputs not "
-                        "implemented yet. Many-to-one mappings are "
-                        "not reversible. "
-                        f"({key} -> {self.reverse_mappings[key]})",
-                    )
-                else:
-                    query = query.replace(
-                        a,
-                        ":" + self.reverse_mappings[key] + ")",
-                    ).replace(b, ":" + self.reverse_mappings[key] + "]")
-        return query
+        if not self.reverse_mappings:
+            return query
+
+        if self._reverse_translate_pattern is None:
+            # longest keys first, so that a key that is a prefix of another
+            # does not shadow it in the alternation; one scan of the query
+            # replaces all keys at once
+            alternation = "|".join(re.escape(key) for key in sorted(self.reverse_mappings, key=len, reverse=True))
+            # TODO the closing delimiters probably do not cover all cases
+            self._reverse_translate_pattern = re.compile(f":({alternation})([)\\]])")
+
+        def _replace(match):
+            original = self.reverse_mappings[match.group(1)]
+
+            if isinstance(original, list):
+                raise NotImplementedError(
+                    "Reverse translation of multiple inputs not "
+                    "implemented yet. Many-to-one mappings are "
+                    "not reversible. "
+                    f"({match.group(1)} -> {original})",
+                )
+
+            return ":" + original + match.group(2)
+
+        return self._reverse_translate_pattern.sub(_replace, query)
 
     def _add_translation_mappings(self, original_name, biocypher_name):
         """
@@ -418,39 +444,47 @@ class Translator:
         PascalCase version of the BioCypher name, since sentence case is
         not useful for Cypher queries.
         """
+        self._translate_pattern = None
+        self._reverse_translate_pattern = None
+
+        # intern the mapping keys and values: the same labels recur across
+        # schema entries, so distinct strings are stored only once; batch
+        # insertion via dict.update instead of per-key assignment
         if isinstance(original_name, list):
-            for on in original_name:
-                self.mappings[on] = self.name_sentence_to_pascal(
-                    biocypher_name,
-                )
+            pascal = sys.intern(self.name_sentence_to_pascal(biocypher_name))
+            self.mappings.update(
+                dict.fromkeys(map(sys.intern, original_name), pascal),
+            )
         else:
-            self.mappings[original_name] = self.name_sentence_to_pascal(
-                biocypher_name,
+            self.mappings[sys.intern(original_name)] = sys.intern(
+                self.name_sentence_to_pascal(biocypher_name),
             )
 
         if isinstance(biocypher_name, list):
-            for bn in biocypher_name:
-                self.reverse_mappings[
-                    self.name_sentence_to_pascal(
-                        bn,
-                    )
-                ] = original_name
+            self.reverse_mappings.update(
+                {self.name_sentence_to_pascal(bn): original_name for bn in biocypher_name},
+            )
         else:
-            self.reverse_mappings[
-                self.name_sentence_to_pascal(
-                    biocypher_name,
-                )
-            ] = original_name
+            self.reverse_mappings[self.name_sentence_to_pascal(biocypher_name)] = original_name
 
     @staticmethod
     def name_sentence_to_pascal(name: str) -> str:
         """
         Converts a name in sentence case to pascal case.
         """
-        # split on dots if dot is present
-        if "." in name:
-            return ".".join(
-                [_misc.sentencecase_to_pascalcase(n) for n in name.split(".")],
-            )
-        else:
-            return _misc.sentencecase_to_pascalcase(name)
+        return _name_sentence_to_pascal(name)
+
+
+@lru_cache(maxsize=4096)
+def _name_sentence_to_pascal(name: str) -> str:
+    """
+    Cached sentence case to pascal case conversion; entity names repeat
+    heavily across translation and writing loops.
+    """
+    # split on dots if dot is present
+    if "." in name:
+        return ".".join(
+            [_misc.sentencecase_to_pascalcase(n) for n in name.split(".")],
+        )
+    else:
+        return _misc.sentencecase_to_pascalcase(name)
@@ -35,6 +35,10 @@ def get_connector(
             password=dbms_config["password"],
             multi_db=dbms_config["multi_db"],
             translator=translator,
+            insert_batch_size=dbms_config.get("insert_batch_size", 10000),
+            max_connection_pool_size=dbms_config.get("max_connection_pool_size"),
+            max_connection_lifetime=dbms_config.get("max_connection_lifetime"),
+            connection_acquisition_timeout=dbms_config.get("connection_acquisition_timeout"),
         )
     else:
         raise NotImplementedError(f"Online mode is not supported for the DBMS {dbms}.")
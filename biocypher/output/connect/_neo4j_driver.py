@@ -6,8 +6,11 @@ import itertools
 
 from collections.abc import Iterable
 
+import neo4j
 import neo4j_utils
 
+from more_itertools import chunked
+
 from biocypher import _misc
 from biocypher._create import BioCypherEdge, BioCypherNode
 from biocypher._logger import logger
@@ -42,6 +45,19 @@ class _Neo4jDriver:
 
         translator (Translator): The translator to use for mapping.
 
+        insert_batch_size (int): The number of entities per server-side
+            transaction batch when merging nodes and edges.
+
+        max_connection_pool_size (int): Maximum number of connections in
+            the driver's pool; raise for concurrent workloads (each idle
+            connection holds a few MB).
+
+        max_connection_lifetime (float): Seconds after which pooled
+            connections are recycled.
+
+        connection_acquisition_timeout (float): Seconds to wait for a free
+            connection from the pool.
+
     """
 
     def __init__(
@@ -55,10 +71,29 @@ class _Neo4jDriver:
         wipe: bool = False,
         fetch_size: int = 1000,
         increment_version: bool = True,
+        insert_batch_size: int = 10000,
+        max_connection_pool_size: int | None = None,
+        max_connection_lifetime: float | None = None,
+        connection_acquisition_timeout: float | None = None,
     ):
         self.translator = translator
+        self._insert_batch_size = insert_batch_size
+        self._db_name = database_name
+
+        # neo4j_utils does not forward pool settings to the underlying
+        # driver, so when any are requested we build the neo4j driver
+        # ourselves and hand it over ready-made
+        pool_args = {
+            "max_connection_pool_size": max_connection_pool_size,
+            "max_connection_lifetime": max_connection_lifetime,
+            "connection_acquisition_timeout": connection_acquisition_timeout,
+        }
+        pool_args = {k: v for k, v in pool_args.items() if v is not None}
+
+        driver = neo4j.GraphDatabase.driver(uri=uri, auth=(user, password), **pool_args) if pool_args else None
 
         self._driver = neo4j_utils.Driver(
+            driver=driver,
             db_name=database_name,
             db_uri=uri,
             db_user=user,
@@ -88,16 +123,21 @@ class _Neo4jDriver:
         # add version node
         self.add_biocypher_nodes(self.translator.ontology)
 
-        # connect version node to previous
+        # connect version node to previous; single round-trip instead of
+        # going through the generic edge batching, which issues three
+        # queries for this one relationship
         if db_version[0]:
             previous = db_version[0][0]
             previous_id = previous["v"]["id"]
-            e_meta = BioCypherEdge(
-                previous_id,
-                self.translator.ontology.get_dict().get("node_id"),
-                "PRECEDES",
+            self._driver.query(
+                "MATCH (p:BioCypher {id: $previous_id}) "
+                "MATCH (n:BioCypher {id: $current_id}) "
+                "MERGE (p)-[:PRECEDES]->(n)",
+                parameters={
+                    "previous_id": previous_id,
+                    "current_id": self.translator.ontology.get_dict().get("node_id"),
+                },
             )
-            self.add_biocypher_edges(e_meta)
 
     def init_db(self):
         """
@@ -125,16 +165,25 @@ class _Neo4jDriver:
         logger.info("Creating constraints for node types in config.")
 
         major_neo4j_version = int(self._get_neo4j_version().split(".")[0])
-        # get structure
+        # collect the DDL statements first, then issue them over a single
+        # session instead of one driver round-trip per leaf
+        stmts = []
         for leaf in self.translator.ontology.mapping.extended_schema.items():
             label = _misc.sentencecase_to_pascalcase(leaf[0], sep=r"\s\.")
             if leaf[1]["represented_as"] == "node":
                 if major_neo4j_version >= 5:
-                    s = f"CREATE CONSTRAINT `{label}_id` " f"IF NOT EXISTS FOR (n:`{label}`) " "REQUIRE n.id IS UNIQUE"
-                    self._driver.query(s)
+                    stmts.append(
+                        f"CREATE CONSTRAINT `{label}_id` " f"IF NOT EXISTS FOR (n:`{label}`) " "REQUIRE n.id IS UNIQUE"
+                    )
                 else:
-                    s = f"CREATE CONSTRAINT `{label}_id` " f"IF NOT EXISTS ON (n:`{label}`) " "ASSERT n.id IS UNIQUE"
-                    self._driver.query(s)
+                    stmts.append(
+                        f"CREATE CONSTRAINT `{label}_id` " f"IF NOT EXISTS ON (n:`{label}`) " "ASSERT n.id IS UNIQUE"
+                    )
+
+        if stmts:
+            with self._driver.session(**self._session_args()) as session:
+                for s in stmts:
+                    session.run(s)
 
     def _get_neo4j_version(self):
         """Get neo4j version."""
@@ -152,6 +201,77 @@ class _Neo4jDriver:
             logger.warning(f"Error detecting Neo4j version: {e} use default version 4.0.0.")
             return "4.0.0"
 
+    def close(self) -> None:
+        """
+        Close the underlying Neo4j driver and its connection pool.
+        """
+
+        self._driver.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # deterministic teardown: the Bolt connections are released here
+        # rather than whenever garbage collection gets around to it
+        self.close()
+
+    def _session_args(self) -> dict:
+        """
+        Session arguments for write sessions on the configured database.
+
+        ``neo4j_utils.Driver.session`` is a bare passthrough that does not
+        apply ``db_name`` by itself; mirror the arguments ``query`` builds
+        for writes, so sessions target the configured database instead of
+        the server default.
+        """
+
+        session_args = {"default_access_mode": neo4j.WRITE_ACCESS}
+
+        if self._driver.multi_db:
+            session_args["database"] = self._db_name or neo4j.DEFAULT_DATABASE
+
+        return session_args
+
+    def _write_summary(self, query: str, parameters: dict | None = None):
+        """
+        Run a write query and return only its result summary.
+
+        Intended for queries that return at most a statistics row, such
+        as the ``apoc.periodic.iterate`` wrappers used for inserts;
+        unlike :meth:`query`, no per-entity records are built just to be
+        discarded.
+
+        ``apoc.periodic.iterate`` does not raise on failures inside its
+        batches; it reports them in its stats record instead. Those
+        failures are surfaced here as errors, so that e.g. a constraint
+        violation does not pass silently.
+
+        Args:
+            query (str): the CYPHER query to run.
+            parameters (dict): parameters to pass to the query.
+
+        Returns:
+            neo4j.ResultSummary: the summary of the executed query.
+
+        Raises:
+            RuntimeError: if the query reports failed batches.
+        """
+
+        with self._driver.session(**self._session_args()) as session:
+            result = session.run(query, parameters or {})
+
+            for record in result:
+                if record.get("failedBatches") or record.get("errorMessages"):
+                    msg = (
+                        f"{record.get('failedBatches')} batch(es) failed "
+                        f"during batched write: {record.get('errorMessages')}"
+                    )
+                    logger.error(msg)
+                    raise RuntimeError(msg)
+
+            return result.consume()
+
     def add_nodes(self, id_type_tuples: Iterable[tuple]) -> tuple:
         """
         Generic node adder method to add any kind of input to the graph via the
@@ -212,6 +332,7 @@ class _Neo4jDriver:
         nodes: Iterable[BioCypherNode],
         explain: bool = False,
         profile: bool = False,
+        upsert: bool = True,
     ) -> bool:
         """
         Accepts a node type handoff class
@@ -234,42 +355,91 @@ class _Neo4jDriver:
                 Call ``EXPLAIN`` on the CYPHER query.
             profile:
                 Do profiling on the CYPHER query.
+            upsert:
+                Merge on node id (default). If ``False``, deduplicate by
+                id client-side and ``CREATE`` the nodes outright, which
+                skips the per-id index lookup and lock of the merge; only
+                safe when the database does not already contain the ids,
+                e.g. after a wipe.
 
         Returns:
             True for success, False otherwise.
         """
 
-        try:
-            nodes = _misc.to_list(nodes)
-
-            entities = [node.get_dict() for node in nodes]
-
-        except AttributeError:
-            msg = "Nodes must have a `get_dict` method."
-            logger.error(msg)
-
-            raise ValueError(msg)
-
-        logger.info(f"Merging {len(entities)} nodes.")
-
-        entity_query = (
-            "UNWIND $entities AS ent "
-            "CALL apoc.merge.node([ent.node_label], "
-            "{id: ent.node_id}, ent.properties, ent.properties) "
-            "YIELD node "
-            "RETURN node"
-        )
-
-        method = "explain" if explain else "profile" if profile else "query"
+        # batch the merges server-side: apoc.periodic.iterate commits in
+        # chunks instead of serialising one giant transaction per flush;
+        # parallel execution is off because the unique-id constraint locks
+        # would contend
+        if upsert:
+            entity_query = (
+                "CALL apoc.periodic.iterate("
+                "'UNWIND $entities AS ent RETURN ent', "
+                "'CALL apoc.merge.node([ent.node_label], "
+                "{id: ent.node_id}, ent.properties, ent.properties) "
+                "YIELD node RETURN node', "
+                "{batchSize: $batch_size, parallel: false, "
+                "params: {entities: $entities}})"
+            )
+        else:
+            # duplicates are removed client-side below, so a plain CREATE
+            # suffices; the label is applied dynamically via APOC
+            entity_query = (
+                "CALL apoc.periodic.iterate("
+                "'UNWIND $entities AS ent RETURN ent', "
+                "'CREATE (n) SET n += ent.properties "
+                "WITH n, ent "
+                "CALL apoc.create.addLabels(n, [ent.node_label]) "
+                "YIELD node RETURN node', "
+                "{batchSize: $batch_size, parallel: false, "
+                "params: {entities: $entities}})"
+            )
 
-        result = getattr(self._driver, method)(
-            entity_query,
-            parameters={
-                "entities": entities,
-            },
-        )
+        method = "explain" if explain else "profile" if profile else None
+        # bind the runner once instead of resolving it per chunk; the
+        # plain write path discards the records and keeps only the summary
+        run = getattr(self._driver, method) if method else self._write_summary
+
+        # materialise the handoff dicts chunk by chunk instead of for the
+        # whole input at once: while the driver ships one chunk, Python
+        # builds the next, and peak memory stays bounded
+        total = 0
+        # an empty input produces no chunks; that is a successful no-op,
+        # not a failure, so the default must be truthy
+        result = True
+        seen_ids = set()
+
+        for chunk in chunked(_misc.ensure_iterable(nodes), self._insert_batch_size):
+            try:
+                entities = [node.get_dict() for node in chunk]
+
+            except AttributeError:
+                msg = "Nodes must have a `get_dict` method."
+                logger.error(msg)
+
+                raise ValueError(msg)
+
+            if not upsert:
+                # CREATE relies on the input being duplicate-free; drop
+                # repeated ids across the whole stream
+                fresh = []
+                for ent in entities:
+                    if ent["node_id"] not in seen_ids:
+                        seen_ids.add(ent["node_id"])
+                        fresh.append(ent)
+                entities = fresh
+
+            total += len(entities)
+            logger.debug(f"Merging {len(entities)} nodes.")
+
+            result = run(
+                entity_query,
+                parameters={
+                    "entities": entities,
+                    "batch_size": self._insert_batch_size,
+                },
+            )
 
-        logger.info("Finished merging nodes.")
+        logger.info(f"Finished merging {total} nodes.")
 
         return result
 
@@ -312,20 +482,33 @@ class _Neo4jDriver:
         """
 
         edges = _misc.ensure_iterable(edges)
-        edges = itertools.chain(*(_misc.ensure_iterable(i) for i in edges))
+        # from_iterable keeps the flattening lazy; chain(*...) would expand
+        # the whole outer generator into an argument tuple up front
+        edges = itertools.chain.from_iterable(_misc.ensure_iterable(i) for i in edges)
 
         nodes = []
         rels = []
 
+        def rel_dict(e):
+            # enrich the handoff dict with the endpoint labels where the
+            # edge carries them; they select the labelled merge below
+            d = e.get_dict()
+
+            if e.get_source_label() and e.get_target_label():
+                d["source_label"] = e.get_source_label()
+                d["target_label"] = e.get_target_label()
+
+            return d
+
         try:
             for e in edges:
                 if hasattr(e, "get_node"):
                     nodes.append(e.get_node())
-                    rels.append(e.get_source_edge().get_dict())
-                    rels.append(e.get_target_edge().get_dict())
+                    rels.append(rel_dict(e.get_source_edge()))
+                    rels.append(rel_dict(e.get_target_edge()))
 
                 else:
-                    rels.append(e.get_dict())
+                    rels.append(rel_dict(e))
 
         except AttributeError:
             msg = "Edges and nodes must have a `get_dict` method."
@@ -333,33 +516,55 @@ class _Neo4jDriver:
 
             raise ValueError(msg)
 
-        self.add_biocypher_nodes(nodes)
+        if nodes:
+            # only reified relationships carry sidecar nodes; skip the
+            # round-trip entirely for ordinary edge batches
+            self.add_biocypher_nodes(nodes)
         logger.info(f"Merging {len(rels)} edges.")
 
         # cypher query
 
         # merging only on the ids of the entities, passing the
-        # properties on match and on create;
-        # TODO add node labels?
-        node_query = "UNWIND $rels AS r " "MERGE (src {id: r.source_id}) " "MERGE (tar {id: r.target_id}) "
-
-        self._driver.query(node_query, parameters={"rels": rels})
+        # properties on match and on create
+
+        # endpoint and relationship merges are fused into one query:
+        # the endpoints come out of the MERGE already bound, so the
+        # former second pass (MATCH by id) is free, and each flush costs
+        # a single round-trip. parallel stays off: merging relationships
+        # takes locks on both endpoint nodes, and hub nodes would
+        # deadlock parallel batches
+        if rels and all("source_label" in r for r in rels):
+            # with endpoint labels, the merges hit the label-scoped id
+            # uniqueness index; the unlabelled MERGE below has to scan
+            # all nodes because constraints are per-label
+            endpoint_merge = (
+                "CALL apoc.merge.node([r.source_label], "
+                "{id: r.source_id}, {}, {}) YIELD node AS src "
+                "CALL apoc.merge.node([r.target_label], "
+                "{id: r.target_id}, {}, {}) YIELD node AS tar "
+            )
+        else:
+            endpoint_merge = "MERGE (src {id: r.source_id}) " "MERGE (tar {id: r.target_id}) "
 
         edge_query = (
-            "UNWIND $rels AS r "
-            "MATCH (src {id: r.source_id}) "
-            "MATCH (tar {id: r.target_id}) "
-            "WITH src, tar, r "
+            "CALL apoc.periodic.iterate("
+            "'UNWIND $rels AS r RETURN r', "
+            "'" + endpoint_merge + "WITH src, tar, r "
             "CALL apoc.merge.relationship"
             "(src, r.relationship_label, NULL, "
             "r.properties, tar, r.properties) "
-            "YIELD rel "
-            "RETURN rel"
+            "YIELD rel RETURN rel', "
+            "{batchSize: $batch_size, parallel: false, "
+            "params: {rels: $rels}})"
         )
 
-        method = "explain" if explain else "profile" if profile else "query"
+        method = "explain" if explain else "profile" if profile else None
+        run = getattr(self._driver, method) if method else self._write_summary
 
-        result = getattr(self._driver, method)(edge_query, parameters={"rels": rels})
+        result = run(
+            edge_query,
+            parameters={"rels": rels, "batch_size": self._insert_batch_size},
+        )
 
         logger.info("Finished merging edges.")
 
@@ -11,6 +11,15 @@ class PandasKG(_InMemoryKG):
 
         self.dfs = {}
 
+        # type-keyed dispatch to the matching deduplicator check; built
+        # once so the per-entity loop does a single dict lookup instead
+        # of an isinstance chain
+        self._seen_dispatch = {
+            BioCypherNode: deduplicator.node_seen,
+            BioCypherEdge: deduplicator.edge_seen,
+            BioCypherRelAsNode: deduplicator.rel_as_node_seen,
+        }
+
     def get_kg(self):
         return self.dfs
 
@@ -27,50 +36,26 @@ class PandasKG(_InMemoryKG):
         """
         lists = {}
         for entity in entities:
-            if (
-                not isinstance(entity, BioCypherNode)
-                and not isinstance(entity, BioCypherEdge)
-                and not isinstance(entity, BioCypherRelAsNode)
-            ):
+            seen_check = self._seen_dispatch.get(type(entity))
+
+            if seen_check is None:
                 raise TypeError(
                     "Expected a BioCypherNode / BioCypherEdge / " f"BioCypherRelAsNode, got {type(entity)}."
                 )
 
-            if isinstance(entity, BioCypherNode):
-                seen = self.deduplicator.node_seen(entity)
-            elif isinstance(entity, BioCypherEdge):
-                seen = self.deduplicator.edge_seen(entity)
-            elif isinstance(entity, BioCypherRelAsNode):
-                seen = self.deduplicator.rel_as_node_seen(entity)
-
-            if seen:
+            if seen_check(entity):
                 continue
 
             if isinstance(entity, BioCypherRelAsNode):
-                node = entity.get_node()
-                source_edge = entity.get_source_edge()
-                target_edge = entity.get_target_edge()
-
-                _type = node.get_type()
-                if _type not in lists:
-                    lists[_type] = []
-                lists[_type].append(node)
-
-                _source_type = source_edge.get_type()
-                if _source_type not in lists:
-                    lists[_source_type] = []
-                lists[_source_type].append(source_edge)
-
-                _target_type = target_edge.get_type()
-                if _target_type not in lists:
-                    lists[_target_type] = []
-                lists[_target_type].append(target_edge)
+                for part in (
+                    entity.get_node(),
+                    entity.get_source_edge(),
+                    entity.get_target_edge(),
+                ):
+                    lists.setdefault(part.get_type(), []).append(part)
                 continue
 
-            _type = entity.get_type()
-            if _type not in lists:
-                lists[_type] = []
-            lists[_type].append(entity)
+            lists.setdefault(entity.get_type(), []).append(entity)
 
         return lists
 
@@ -86,8 +71,8 @@ class PandasKG(_InMemoryKG):
 
     def _add_entity_df(self, _type, _entities):
         df = pd.DataFrame(pd.json_normalize([node.get_dict() for node in _entities]))
-        # replace "properties." with "" in column names
-        df.columns = [col.replace("properties.", "") for col in df.columns]
+        # strip the "properties." prefix from column names
+        df.columns = [col.removeprefix("properties.") for col in df.columns]
         if _type not in self.dfs:
             self.dfs[_type] = df
         else:
@@ -4,6 +4,7 @@ import re
 
 from abc import ABC, abstractmethod
 from collections import OrderedDict, defaultdict
+from functools import lru_cache
 from types import GeneratorType
 
 from more_itertools import peekable
@@ -255,6 +256,7 @@ class _BatchWriter(_Writer, ABC):
         self._import_call_file_prefix = import_call_file_prefix
 
         self.parts = {}  # dict to store the paths of part files for each label
+        self._schema_label_cache = {}  # memo for edge label -> schema class
 
         self._labels_orders = ["Alphabetical", "Ascending", "Descending", "Leaves"]
         if labels_order not in self._labels_orders:
@@ -408,9 +410,8 @@ class _BatchWriter(_Writer, ABC):
             logger.debug("Writing node CSV from generator.")
 
             bins = defaultdict(list)  # dict to store a list for each
-            # label that is passed in
-            bin_l = {}  # dict to store the length of each list for
-            # batching cutoff
+            # label that is passed in; the batching cutoff uses the list
+            # length directly, no separate length bookkeeping
             reference_props = defaultdict(
                 dict,
             )  # dict to store a dict of properties
@@ -418,6 +419,8 @@ class _BatchWriter(_Writer, ABC):
             # for now, relevant for `int`
             labels = {}  # dict to store the additional labels for each
             # primary graph constituent from biolink hierarchy
+            # hoist the schema lookup out of the per-node loop
+            extended_schema = self.translator.ontology.mapping.extended_schema
             for node in nodes:
                 # check if node has already been written, if so skip
                 if self.deduplicator.node_seen(node):
@@ -431,15 +434,14 @@ class _BatchWriter(_Writer, ABC):
                     logger.warning(f"Node {label} has no id; skipping.")
                     continue
 
-                if label not in bins.keys():
+                if label not in bins:
                     # start new list
                     all_labels = None
                     bins[label].append(node)
-                    bin_l[label] = 1
 
                     # get properties from config if present
-                    if label in self.translator.ontology.mapping.extended_schema:
-                        cprops = self.translator.ontology.mapping.extended_schema.get(label).get(
+                    if label in extended_schema:
+                        cprops = extended_schema.get(label).get(
                             "properties",
                         )
                     else:
@@ -515,12 +517,12 @@ class _BatchWriter(_Writer, ABC):
 
                 else:
                     # add to list
-                    bins[label].append(node)
-                    bin_l[label] += 1
-                    if not bin_l[label] < batch_size:
+                    bin_ = bins[label]
+                    bin_.append(node)
+                    if len(bin_) >= batch_size:
                         # batch size controlled here
                         passed = self._write_single_node_list_to_file(
-                            bins[label],
+                            bin_,
                             label,
                             reference_props[label],
                             labels[label],
@@ -530,7 +532,6 @@ class _BatchWriter(_Writer, ABC):
                             return False
 
                         bins[label] = []
-                        bin_l[label] = 0
 
             # after generator depleted, write remainder of bins
             for label, nl in bins.items():
@@ -550,7 +551,7 @@ class _BatchWriter(_Writer, ABC):
             # properties in the generator pass
 
             # save config or first-node properties to instance attribute
-            for label in reference_props.keys():
+            for label in reference_props:
                 self.node_property_dict[label] = reference_props[label]
 
             return True
@@ -599,9 +600,9 @@ class _BatchWriter(_Writer, ABC):
             # check for deviations in properties
             # node properties
             n_props = n.get_properties()
-            n_keys = list(n_props.keys())
+            n_keys = list(n_props)
             # reference properties
-            ref_props = list(prop_dict.keys())
+            ref_props = list(prop_dict)
 
             # compare lists order invariant
             if set(ref_props) != set(n_keys):
@@ -681,14 +682,15 @@ class _BatchWriter(_Writer, ABC):
             logger.debug("Writing edge CSV from generator.")
 
             bins = defaultdict(list)  # dict to store a list for each
-            # label that is passed in
-            bin_l = {}  # dict to store the length of each list for
-            # batching cutoff
+            # label that is passed in; the batching cutoff uses the list
+            # length directly, no separate length bookkeeping
             reference_props = defaultdict(
                 dict,
             )  # dict to store a dict of properties
             # for each label to check for consistency and their type
             # for now, relevant for `int`
+            # hoist the schema lookup out of the per-edge loop
+            extended_schema = self.translator.ontology.mapping.extended_schema
             for edge in edges:
                 if not (edge.get_source_id() and edge.get_target_id()):
                     logger.error(
@@ -698,10 +700,9 @@ class _BatchWriter(_Writer, ABC):
 
                 label = edge.get_label()
 
-                if label not in bins.keys():
+                if label not in bins:
                     # start new list
                     bins[label].append(edge)
-                    bin_l[label] = 1
 
                     # get properties from config if present
 
@@ -709,8 +710,8 @@ class _BatchWriter(_Writer, ABC):
                     # (may not be if it is an edge that carries the
                     # "label_as_edge" property)
                     cprops = None
-                    if label in self.translator.ontology.mapping.extended_schema:
-                        cprops = self.translator.ontology.mapping.extended_schema.get(label).get(
+                    if label in extended_schema:
+                        cprops = extended_schema.get(label).get(
                             "properties",
                         )
                     else:
@@ -718,7 +719,7 @@ class _BatchWriter(_Writer, ABC):
                         for (
                             k,
                             v,
-                        ) in self.translator.ontology.mapping.extended_schema.items():
+                        ) in extended_schema.items():
                             if isinstance(v, dict):
                                 if v.get("label_as_edge") == label:
                                     cprops = v.get("properties")
@@ -751,12 +752,12 @@ class _BatchWriter(_Writer, ABC):
 
                 else:
                     # add to list
-                    bins[label].append(edge)
-                    bin_l[label] += 1
-                    if not bin_l[label] < batch_size:
+                    bin_ = bins[label]
+                    bin_.append(edge)
+                    if len(bin_) >= batch_size:
                         # batch size controlled here
                         passed = self._write_single_edge_list_to_file(
-                            bins[label],
+                            bin_,
                             label,
                             reference_props[label],
                         )
@@ -765,7 +766,6 @@ class _BatchWriter(_Writer, ABC):
                             return False
 
                         bins[label] = []
-                        bin_l[label] = 0
 
             # after generator depleted, write remainder of bins
             for label, nl in bins.items():
@@ -784,7 +784,7 @@ class _BatchWriter(_Writer, ABC):
             # properties in the generator pass
 
             # save first-edge properties to instance attribute
-            for label in reference_props.keys():
+            for label in reference_props:
                 self.edge_property_dict[label] = reference_props[label]
 
             return True
@@ -798,6 +798,42 @@ class _BatchWriter(_Writer, ABC):
 
             return self._write_edge_data(gen(edges), batch_size=batch_size)
 
+    def _resolve_schema_label(self, label: str) -> str | None:
+        """Resolve an edge label to its schema class.
+
+        Checks the schema directly first, then falls back to scanning
+        for a matching ``label_as_edge``. The linear scan only runs once
+        per label; results (including misses) are memoised on the
+        writer.
+
+        Args:
+        ----
+            label (str): the label (type) of the edge
+
+        Returns:
+        -------
+            str | None: the schema class name, or None if not found
+
+        """
+        try:
+            return self._schema_label_cache[label]
+        except KeyError:
+            pass
+
+        extended_schema = self.translator.ontology.mapping.extended_schema
+
+        if extended_schema.get(label):
+            schema_label = label
+        else:
+            schema_label = None
+            for k, v in extended_schema.items():
+                if v.get("label_as_edge") == label:
+                    schema_label = k
+                    break
+
+        self._schema_label_cache[label] = schema_label
+        return schema_label
+
     def _write_single_edge_list_to_file(
         self,
         edge_list: list,
@@ -825,14 +861,33 @@ class _BatchWriter(_Writer, ABC):
             logger.error("Edges must be passed as type BioCypherEdge.")
             return False
 
+        # the label is constant for the whole list; resolve the schema
+        # class and the id-skipping decision once instead of per edge
+        skip_id = False
+        schema_label = None
+
+        if label in ["IS_SOURCE_OF", "IS_TARGET_OF", "IS_PART_OF"]:
+            skip_id = True
+        else:
+            schema_label = self._resolve_schema_label(label)
+
+        if schema_label:
+            if (
+                self.translator.ontology.mapping.extended_schema.get(
+                    schema_label,
+                ).get("use_id")
+                == False  # noqa: E712 (seems to not work with 'not')
+            ):
+                skip_id = True
+
         # from list of edges to list of strings
         lines = []
         for e in edge_list:
             # check for deviations in properties
             # edge properties
             e_props = e.get_properties()
-            e_keys = list(e_props.keys())
-            ref_props = list(prop_dict.keys())
+            e_keys = list(e_props)
+            ref_props = list(prop_dict)
 
             # compare list order invariant
             if set(ref_props) != set(e_keys):
@@ -873,32 +928,6 @@ class _BatchWriter(_Writer, ABC):
 
             entries = [e.get_source_id()]
 
-            skip_id = False
-            schema_label = None
-
-            if label in ["IS_SOURCE_OF", "IS_TARGET_OF", "IS_PART_OF"]:
-                skip_id = True
-            elif not self.translator.ontology.mapping.extended_schema.get(label):
-                # find label in schema by label_as_edge
-                for (
-                    k,
-                    v,
-                ) in self.translator.ontology.mapping.extended_schema.items():
-                    if v.get("label_as_edge") == label:
-                        schema_label = k
-                        break
-            else:
-                schema_label = label
-
-            if schema_label:
-                if (
-                    self.translator.ontology.mapping.extended_schema.get(
-                        schema_label,
-                    ).get("use_id")
-                    == False  # noqa: E712 (seems to not work with 'not')
-                ):
-                    skip_id = True
-
             if not skip_id:
                 entries.append(e.get_id() or "")
 
@@ -1005,11 +1034,26 @@ class _BatchWriter(_Writer, ABC):
         return file_path
 
 
+# characters compliant with Neo4j naming conventions, compiled once instead
+# of per parse_label call
+_ALLOWED_LABEL_CHARS = re.compile(r"[a-zA-Z0-9_$ .]")
+_DISALLOWED_LABEL_CHARS = re.compile(r"[^a-zA-Z0-9_$ .]")
+
+
+def _first_character_compliant(character: str) -> bool:
+    return character.isalpha() or character == "$"
+
+
+@lru_cache(maxsize=None)
 def parse_label(label: str) -> str:
     """Check if the label is compliant with Neo4j naming conventions,
     https://neo4j.com/docs/cypher-manual/current/syntax/naming/, and if not,
     remove non-compliant characters.
 
+    The same handful of labels recurs once per written entity, so results
+    are memoised; the regex scans (and the non-compliance warnings) run
+    once per distinct label instead of once per node or edge.
+
     Args:
     ----
         label (str): The label to check
@@ -1019,21 +1063,17 @@ def parse_label(label: str) -> str:
     """
     # Check if the name contains only alphanumeric characters, underscore, or dollar sign
     # and dot (for class hierarchy of BioCypher)
-    allowed_chars = r"a-zA-Z0-9_$ ."
-    matches = re.findall(f"[{allowed_chars}]", label)
-    non_matches = re.findall(f"[^{allowed_chars}]", label)
+    matches = _ALLOWED_LABEL_CHARS.findall(label)
+    non_matches = _DISALLOWED_LABEL_CHARS.findall(label)
     if non_matches:
         non_matches = list(set(non_matches))
         logger.warning(
             f"Label is not compliant with Neo4j naming rules. Removed non compliant characters: {non_matches}",
         )
 
-    def first_character_compliant(character: str) -> bool:
-        return character.isalpha() or character == "$"
-
-    if not first_character_compliant(matches[0]):
+    if not _first_character_compliant(matches[0]):
         for c in matches:
-            if first_character_compliant(c):
+            if _first_character_compliant(c):
                 matches = matches[matches.index(c) :]
                 break
         logger.warning("Label does not start with an alphabetic character or with $. Removed non compliant characters.")
@@ -65,7 +65,7 @@ class _ArangoDBBatchWriter(_Neo4jBatchWriter):
 
             # concatenate key:value in props
             props_list = []
-            for k in props.keys():
+            for k in props:
                 props_list.append(f"{k}")
 
             # create list of lists and flatten
@@ -144,7 +144,7 @@ class _ArangoDBBatchWriter(_Neo4jBatchWriter):
 
             # concatenate key:value in props
             props_list = []
-            for k in props.keys():
+            for k in props:
                 props_list.append(f"{k}")
 
             out_list = ["_from", "_key", *props_list, "_to"]
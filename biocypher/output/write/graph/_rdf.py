@@ -452,7 +452,7 @@ class _RDFWriter(_BatchWriter):
         try:
             _pref, _id = subject.split(":")
 
-            if _pref in self.rdf_namespaces.keys():
+            if _pref in self.rdf_namespaces:
                 return self.rdf_namespaces[_pref][_id]
             else:
                 return self.rdf_namespaces["biocypher"][subject]
@@ -30,7 +30,7 @@ class _PandasCSVWriter(_Writer):
             str: Python code to load the csv files into Pandas dfs.
         """
         import_call = "import pandas as pd\n\n"
-        for df_name in self.stored_dfs.keys():
+        for df_name in self.stored_dfs:
             import_call += f"{df_name} = pd.read_csv('./{df_name}.csv', header=0, index_col=0)\n"
         return import_call
 
@@ -56,7 +56,7 @@ class _PandasCSVWriter(_Writer):
         entity_list = self.pandas_in_memory._separate_entity_types(entities)
         for entity_type, entities in entity_list.items():
             self.in_memory_dfs[entity_type] = self.pandas_in_memory._add_entity_df(entity_type, entities)
-        for entity_type in self.in_memory_dfs.keys():
+        for entity_type in self.in_memory_dfs:
             entity_df = self.in_memory_dfs[entity_type]
             if " " in entity_type or "." in entity_type:
                 entity_type = entity_type.replace(" ", "_").replace(".", "_")
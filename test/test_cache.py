@@ -0,0 +1,114 @@
+import gzip
+import logging
+import os
+import pickle
+
+import networkx as nx
+
+from biocypher import _cache
+from biocypher._ontology import OntologyAdapter
+
+
+def test_cache_key_deterministic():
+    key1 = _cache.cache_key("schema_config", "/some/path", 1.0, 42)
+    key2 = _cache.cache_key("schema_config", "/some/path", 1.0, 42)
+    key3 = _cache.cache_key("schema_config", "/some/path", 1.0, 43)
+
+    assert key1 == key2
+    assert key1 != key3
+    # hexadecimal digest, usable as a file name
+    assert all(c in "0123456789abcdef" for c in key1)
+
+
+def test_save_load_roundtrip(tmp_path):
+    key = _cache.cache_key("roundtrip")
+    obj = {"nodes": ["a", "b"], "nested": {"c": [1, 2, 3]}}
+
+    _cache.save(key, obj, cache_dir=str(tmp_path))
+
+    assert _cache.load(key, cache_dir=str(tmp_path)) == obj
+
+
+def test_load_missing_key_is_none(tmp_path):
+    assert _cache.load(_cache.cache_key("absent"), cache_dir=str(tmp_path)) is None
+
+
+def test_load_corrupt_entry_is_none(tmp_path, caplog):
+    key = _cache.cache_key("corrupt")
+    _cache.save(key, [1, 2, 3], cache_dir=str(tmp_path))
+
+    # clobber the entry with bytes that are not even valid gzip
+    path = _cache._cache_path(key, cache_dir=str(tmp_path))
+    with open(path, "wb") as fp:
+        fp.write(b"not a cache entry")
+
+    _cache._read_entry.cache_clear()
+
+    with caplog.at_level(logging.WARNING):
+        assert _cache.load(key, cache_dir=str(tmp_path)) is None
+
+    assert "Could not read cache entry" in caplog.text
+
+
+def test_load_rejects_wrong_magic(tmp_path, caplog):
+    key = _cache.cache_key("foreign")
+    path = _cache._cache_path(key, cache_dir=str(tmp_path))
+
+    # a well-formed gzip pickle, but without the magic/version header
+    with gzip.open(path, "wb") as fp:
+        fp.write(b"XXXXX\x01")
+        pickle.dump([1, 2, 3], fp)
+
+    _cache._read_entry.cache_clear()
+
+    with caplog.at_level(logging.WARNING):
+        assert _cache.load(key, cache_dir=str(tmp_path)) is None
+
+    assert "unknown cache entry format" in caplog.text
+
+
+def test_load_hands_out_copies(tmp_path):
+    key = _cache.cache_key("copies")
+    _cache.save(key, {"props": ["a"]}, cache_dir=str(tmp_path))
+
+    first = _cache.load(key, cache_dir=str(tmp_path))
+    first["props"].append("mutated")
+
+    # the memoised entry must stay pristine despite the mutation above
+    second = _cache.load(key, cache_dir=str(tmp_path))
+    assert second == {"props": ["a"]}
+
+
+def test_save_is_atomic(tmp_path):
+    key = _cache.cache_key("atomic")
+    _cache.save(key, "payload", cache_dir=str(tmp_path))
+
+    # the temp file is moved into place, not left behind
+    path = _cache._cache_path(key, cache_dir=str(tmp_path))
+    assert os.path.exists(path)
+    assert not os.path.exists(f"{path}.tmp")
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+
+def test_ontology_adapter_cache_roundtrip(tmp_path, monkeypatch):
+    monkeypatch.setattr(_cache, "_CACHE_DIR", str(tmp_path))
+
+    fresh = OntologyAdapter(
+        "test/ontologies/ontology1.ttl",
+        "Thing",
+        use_cache=True,
+    )
+    # the graphs are built (and the cache entry written) lazily
+    fresh_graph = fresh.get_nx_graph()
+    assert os.listdir(tmp_path)
+
+    # drop the in-process memo so the second adapter reads from disk
+    _cache._read_entry.cache_clear()
+
+    cached = OntologyAdapter(
+        "test/ontologies/ontology1.ttl",
+        "Thing",
+        use_cache=True,
+    )
+
+    assert nx.utils.graphs_equal(fresh_graph, cached.get_nx_graph())